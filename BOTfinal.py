@@ -1,153 +1,353 @@
-from collections import UserDict
-from datetime import datetime, date, timedelta
+from bisect import bisect_left, insort
+from datetime import datetime, date
+from functools import lru_cache, partialmethod
+import copy
+import gzip
 import pickle
-from typing import Callable
+import sys
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
 
 
 FILE_NAME = "addressbook.pkl"
 
+T = TypeVar("T")
+
 
 # ==========================
 #       МОДЕЛІ ДАНИХ
 # ==========================
 
-class Field:
-    def __init__(self, value):
+class Field(Generic[T]):
+    # одне місце для значення на всю ієрархію; підкласи перевизначають лише _validate
+    __slots__ = ("_value",)
+
+    def __init__(self, value: T) -> None:
         self.value = value
 
-    def __str__(self):
+    @staticmethod
+    def _validate(value: T) -> None:
+        pass
+
+    @property
+    def value(self) -> T:
+        return self._value
+
+    @value.setter
+    def value(self, new_value: T) -> None:
+        self._validate(new_value)
+        self._value = new_value
+
+    def __str__(self) -> str:
         return str(self.value)
 
+    def __reduce__(self) -> tuple:
+        # у файл іде лише сире значення, без стану об'єкта
+        return self.__class__, (self.value,)
+
+
+class Name(Field[str]):
+    __slots__ = ()
+
+    def __init__(self, value: str) -> None:
+        # один і той самий рядок слугує і ключем книги, і Name.value
+        super().__init__(sys.intern(value))
+
 
-class Name(Field):
-    pass
+# маркер для Phone.from_validated: без нього конструктор Phone завжди валідує
+_TRUSTED = object()
 
 
-class Phone(Field):
+class Phone(Field[str]):
     """Телефон: рівно 10 цифр."""
 
+    __slots__ = ()
+
     @staticmethod
-    def _validate(value: str):
-        if not (value.isdigit() and len(value) == 10):
+    def _validate(value: str) -> None:
+        # isascii() відсікає не-ASCII рядки до проходу isdigit() по Unicode-таблицях
+        if len(value) != 10 or not (value.isascii() and value.isdigit()):
             raise ValueError("Phone number must contain exactly 10 digits.")
 
-    def __init__(self, value: str):
-        self._validate(value)
+    def __init__(self, value: str, _token: object = None) -> None:
+        if _token is not _TRUSTED:
+            self._validate(value)
         self._value = value
 
-    @property
-    def value(self):
-        return self._value
+    @classmethod
+    def from_validated(cls, value: str) -> "Phone":
+        """Створює Phone з уже перевіреного номера, без _validate."""
+        return cls(value, _TRUSTED)
 
-    @value.setter
-    def value(self, new_value: str):
-        self._validate(new_value)
-        self._value = new_value
+
+@lru_cache(maxsize=4096)
+def _parse_bday(value: str) -> date:
+    # однакові дати (імпорт, завантаження файлу) парсяться лише раз
+    day, month, year = value[:2], value[3:5], value[6:]
+    # isascii(): isdigit() пропускає й не-ASCII цифри, які strptime відкидає
+    if (len(value) == 10 and value.isascii() and value[2] == "." and value[5] == "."
+            and day.isdigit() and month.isdigit() and year.isdigit()):
+        # швидкий шлях для DD.MM.YYYY: без strptime і його regex/locale
+        return date(int(year), int(month), int(day))
+    return datetime.strptime(value, "%d.%m.%Y").date()
 
 
-class Birthday(Field):
+class Birthday(Field[date]):
     """Birthday у форматі DD.MM.YYYY."""
 
-    def __init__(self, value: str):
+    __slots__ = ()
+
+    def __init__(self, value: str | date) -> None:
+        if isinstance(value, date):
+            # готова дата (зокрема з файлу книги) не парситься повторно
+            self._value = value
+            return
         try:
-            dt = datetime.strptime(value, "%d.%m.%Y").date()
-            self._value = dt
+            self._value = _parse_bday(value)
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
-    @property
-    def value(self) -> date:
-        return self._value
-
-    @value.setter
-    def value(self, new_value: date):
-        if not isinstance(new_value, date):
-            raise ValueError("Birthday must be a date.")
-        self._value = new_value
+    @staticmethod
+    def _validate(value: date) -> None:
+        # дата незмінна: індекс книги тримає ключ саме цієї дати
+        raise AttributeError("Birthday is read-only; use Record.add_birthday().")
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.value.strftime("%d.%m.%Y")
 
 
 class Record:
     """Один контакт: ім'я, телефони, день народження."""
 
-    def __init__(self, name: str):
+    __slots__ = ("name", "_phones", "_birthday", "_phones_str", "_book")
+
+    def __init__(self, name: str) -> None:
         self.name = Name(name)
-        self.phones: list[Phone] = []
-        self.birthday: Birthday | None = None
+        # номер -> Phone: пошук за O(1), порядок додавання зберігається
+        # назовні лише через read-only phones, щоб _phones_str не застарів
+        self._phones: dict[str, Phone] = {}
+        self._birthday: Birthday | None = None
+        # кеш рядка телефонів для __str__, скидається при кожній зміні
+        self._phones_str: str | None = None
+        # книга, в якій лежить запис: їй повідомляємо про зміну дня народження
+        self._book: AddressBook | None = None
+
+    @property
+    def phones(self) -> MappingProxyType[str, Phone]:
+        return MappingProxyType(self._phones)
+
+    def add_phone(self, phone: str) -> None:
+        ph = Phone(phone)
+        self._phones[ph.value] = ph
+        self._phones_str = None
 
-    def add_phone(self, phone: str):
-        self.phones.append(Phone(phone))
+    def find_phone(self, phone: str) -> Phone | None:
+        return self._phones.get(phone)
 
-    def find_phone(self, phone: str):
-        for ph in self.phones:
-            if ph.value == phone:
-                return ph
-        return None
+    def remove_phone(self, phone: str) -> None:
+        self._phones.pop(phone, None)
+        self._phones_str = None
 
-    def remove_phone(self, phone: str):
-        ph = self.find_phone(phone)
-        if ph:
-            self.phones.remove(ph)
+    def _trusted_add_phones(self, phones: Iterable[str]) -> None:
+        # номери вже перевірені (файл книги, bulk_import), тож без валідації
+        from_validated = Phone.from_validated
+        self._phones.update((phone, from_validated(phone)) for phone in phones)
+        self._phones_str = None
 
-    def edit_phone(self, old: str, new: str):
-        ph = self.find_phone(old)
+    def edit_phone(self, old: str, new: str) -> None:
+        ph = self._phones.get(old)
         if not ph:
             raise ValueError("Old phone number not found.")
         ph.value = new
+        del self._phones[old]
+        self._phones[new] = ph
+        self._phones_str = None
 
-    def add_birthday(self, bday: str):
+    @property
+    def birthday(self) -> Birthday | None:
+        return self._birthday
+
+    @birthday.setter
+    def birthday(self, bday: Birthday | None) -> None:
+        # будь-яке присвоєння (не лише add_birthday) оновлює індекс книги
+        old = self._birthday
+        self._birthday = bday
+        if self._book is not None:
+            self._book._reindex_birthday(self.name.value, old, bday)
+
+    def add_birthday(self, bday: str) -> None:
         self.birthday = Birthday(bday)
 
-    def __str__(self):
-        phones = "; ".join(p.value for p in self.phones) if self.phones else "no phones"
+    def __str__(self) -> str:
+        phones = self._phones_str
+        if phones is None:
+            phones = self._phones_str = "; ".join(self._phones) if self._phones else "no phones"
         if self.birthday:
             return f"Contact name: {self.name.value}, phones: {phones}, birthday: {self.birthday}"
         return f"Contact name: {self.name.value}, phones: {phones}"
 
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.name.value,), (list(self._phones), self.birthday)
 
-class AddressBook(UserDict):
-    """Адресна книга."""
-
-    def add_record(self, record: Record):
-        self.data[record.name.value] = record
+    def __setstate__(self, state: tuple[list[str], Birthday | None]) -> None:
+        phones, self.birthday = state
+        self._trusted_add_phones(phones)
 
-    def find(self, name: str):
-        return self.data.get(name)
 
-    def delete(self, name: str):
-        if name in self.data:
-            del self.data[name]
+# зсув за днем тижня: субота -> +2, неділя -> +1 (перенос на понеділок)
+_WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
 
-    def get_upcoming_birthdays(self) -> list:
-        today = date.today()
-        result = []
 
-        for record in self.data.values():
-            if not record.birthday:
-                continue
+def _bday_key(d: date) -> int:
+    # ключ, що впорядковує дати за місяцем і днем без урахування року
+    return d.month * 32 + d.day
 
-            bday = record.birthday.value
-            birthday_this_year = bday.replace(year=today.year)
 
-            if birthday_this_year < today:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
+def _congratulation_ordinal(ordinal: int) -> int:
+    # ordinal 1 — понеділок, тож день тижня = (ordinal + 6) % 7
+    return ordinal + _WEEKEND_SHIFT[(ordinal + 6) % 7]
 
-            diff = (birthday_this_year - today).days
 
-            if 0 <= diff <= 7:
-                congratulation_date = birthday_this_year
+class AddressBook(dict[str, Record]):
+    """Адресна книга."""
 
-                # перенос на понеділок
-                if congratulation_date.weekday() == 5:
-                    congratulation_date += timedelta(days=2)
-                if congratulation_date.weekday() == 6:
-                    congratulation_date += timedelta(days=1)
+    def __init__(self) -> None:
+        super().__init__()
+        # відсортований список (_bday_key, ім'я) для бінарного пошуку днів народження
+        self._bday_index: list[tuple[int, str]] = []
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (), list(self.values())
+
+    def __setstate__(self, state: list[Record]) -> None:
+        self._bday_index = []
+        for record in state:
+            self.add_record(record)
+
+    # усі способи змінити dict проходять через індекс днів народження
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        if name in self:
+            del self[name]
+        super().__setitem__(name, record)
+        record._book = self
+        self._reindex_birthday(name, None, record.birthday)
+
+    def __delitem__(self, name: str) -> None:
+        record = self[name]
+        super().__delitem__(name)
+        self._unlink(name, record)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name not in self:
+            if default:
+                return default[0]
+            raise KeyError(name)
+        record = self[name]
+        del self[name]
+        return record
+
+    def popitem(self) -> tuple[str, Record]:
+        name, record = super().popitem()
+        self._unlink(name, record)
+        return name, record
+
+    def clear(self) -> None:
+        for record in self.values():
+            record._book = None
+        super().clear()
+        self._bday_index.clear()
+
+    def update(self, *args: Any, **kwargs: Record) -> None:
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def setdefault(self, name: str, default: Record) -> Record:
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def __ior__(self, other: Any) -> "AddressBook":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def copy(self) -> "AddressBook":
+        """Копія книги; запис належить лише одній книзі, тож записи теж копіюються."""
+        book = AddressBook()
+        for name, record in self.items():
+            book[name] = copy.copy(record)
+        return book
+
+    def __copy__(self) -> "AddressBook":
+        return self.copy()
+
+    def _unlink(self, name: str, record: Record) -> None:
+        record._book = None
+        self._reindex_birthday(name, record.birthday, None)
+
+    def _reindex_birthday(self, name: str, old: Birthday | None, new: Birthday | None) -> None:
+        index = self._bday_index
+        if old is not None:
+            entry = (_bday_key(old.value), name)
+            i = bisect_left(index, entry)
+            if i < len(index) and index[i] == entry:
+                del index[i]
+        if new is not None:
+            insort(index, (_bday_key(new.value), name))
+
+    def add_record(self, record: Record) -> None:
+        self[record.name.value] = record
+
+    def bulk_import(self, rows: Iterable[tuple[str, Iterable[str], str | None]]) -> None:
+        """Масовий імпорт (ім'я, телефони, день народження); телефони мають бути вже перевірені."""
+        for name, phones, bday in rows:
+            record = self.find(name)
+            if record is None:
+                record = Record(name)
+                self.add_record(record)
+            record._trusted_add_phones(phones)
+            if bday:
+                record.add_birthday(bday)
+
+    def find(self, name: str) -> Record | None:
+        return self.get(name)
+
+    def delete(self, name: str) -> None:
+        if name in self:
+            del self[name]
+
+    def get_upcoming_birthdays(self) -> list[dict[str, str]]:
+        index = self._bday_index
+        if not index:
+            # у жодного контакту немає дня народження
+            return []
 
+        today = date.today()
+        today_ord = today.toordinal()
+        end = date.fromordinal(today_ord + 7)
+        result: list[dict[str, str]] = []
+
+        # O(log n + k): беремо з індексу лише вікно [today, today + 7]
+        lo = bisect_left(index, (_bday_key(today),))
+        hi = bisect_left(index, (_bday_key(end) + 1,))
+        windows: tuple[tuple[int, list[tuple[int, str]]], ...]
+        if end.year == today.year:
+            windows = ((today.year, index[lo:hi]),)
+        else:
+            # вікно перетинає Новий рік: кінець списку і його початок
+            windows = ((today.year, index[lo:]), (end.year, index[:hi]))
+
+        # рахуємо на цілих ordinal-днях, у date перетворюємо лише збіги
+        for year, entries in windows:
+            for key, name in entries:
+                if name not in self:
+                    continue
+                # місяць і день беремо з ключа індексу, без доступу до запису
+                this_year_ord = date(year, key // 32, key % 32).toordinal()
+                congratulation_ord = _congratulation_ordinal(this_year_ord)
                 result.append({
-                    "name": record.name.value,
-                    "congratulation_date": congratulation_date.strftime("%Y.%m.%d")
+                    "name": name,
+                    "congratulation_date": date.fromordinal(congratulation_ord).strftime("%Y.%m.%d")
                 })
 
         return result
@@ -157,45 +357,65 @@ class AddressBook(UserDict):
 #  СЕРІАЛІЗАЦІЯ PICKLE
 # ==========================
 
-def save_data(book: AddressBook, filename=FILE_NAME):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+def save_data(book: AddressBook, filename: str = FILE_NAME) -> None:
+    # рівень 1: майже весь виграш у розмірі за мінімальний час стиснення
+    with gzip.open(filename, "wb", compresslevel=1) as f:
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# класи, які базова версія зберігала у файл разом з їхнім __dict__
+_LEGACY_CLASSES = frozenset({"AddressBook", "Record", "Name", "Phone", "Birthday"})
+
+
+def _legacy_find_class(unpickler: pickle.Unpickler, module: str, name: str) -> Any:
+    # pickle створює старі об'єкти без виклику __init__, а класи, зібрані mypyc,
+    # так не вміють, тож моделі читаються як SimpleNamespace з тим самим __dict__
+    if module in ("__main__", "BOTfinal") and name in _LEGACY_CLASSES:
+        return SimpleNamespace
+    return pickle.Unpickler.find_class(unpickler, module, name)
+
+
+# через type(): mypyc не вміє компілювати підклас C-класу Unpickler,
+# а partialmethod прив'язує self і до скомпільованої функції
+_LegacyUnpickler = type(
+    "_LegacyUnpickler", (pickle.Unpickler,), {"find_class": partialmethod(_legacy_find_class)}
+)
 
 
-def load_data(filename=FILE_NAME) -> AddressBook:
+def _book_from_legacy(old: Any) -> AddressBook:
+    if not isinstance(old, SimpleNamespace) or not hasattr(old, "data"):
+        raise TypeError("File does not contain an address book.")
+    book = AddressBook()
+    for old_record in old.data.values():
+        record = Record(old_record.name.value)
+        record._trusted_add_phones(ph._value for ph in old_record.phones)
+        if old_record.birthday is not None:
+            record.birthday = Birthday(old_record.birthday._value)
+        book.add_record(record)
+    return book
+
+
+def load_data(filename: str = FILE_NAME) -> AddressBook:
+    """Порожня книга лише якщо файлу немає; інші помилки читання піднімаються."""
     try:
-        with open(filename, "rb") as f:
+        with gzip.open(filename, "rb") as f:
             book = pickle.load(f)
-            if not isinstance(book, AddressBook):
-                return AddressBook()
-            return book
     except FileNotFoundError:
         return AddressBook()
-    except Exception:
-        return AddressBook()
-
-
-# ==========================
-#   ДЕКОРАТОР ПОМИЛОК
-# ==========================
-
-def input_error(func: Callable):
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except (ValueError, KeyError, IndexError) as e:
-            return f"Error: {e}"
-        except Exception as e:
-            return f"Unexpected error: {e}"
-    return wrapper
+    except gzip.BadGzipFile:
+        # файл базової версії: без стиснення, стан об'єктів у __dict__
+        with open(filename, "rb") as f:
+            book = _book_from_legacy(_LegacyUnpickler(f).load())
+    if not isinstance(book, AddressBook):
+        raise TypeError(f"{filename} does not contain an address book.")
+    return book
 
 
 # ==========================
 #     ХЕНДЛЕРИ КОМАНД
 # ==========================
 
-@input_error
-def add_contact(args, book: AddressBook):
+def add_contact(args: Sequence[str], book: AddressBook) -> str:
     name, phone = args[0], args[1]
     record = book.find(name)
     if record is None:
@@ -208,8 +428,7 @@ def add_contact(args, book: AddressBook):
     return message
 
 
-@input_error
-def change_contact(args, book: AddressBook):
+def change_contact(args: Sequence[str], book: AddressBook) -> str:
     name, old_phone, new_phone = args[:3]
     record = book.find(name)
     if record is None:
@@ -218,25 +437,23 @@ def change_contact(args, book: AddressBook):
     return "Phone changed."
 
 
-@input_error
-def show_phone(args, book: AddressBook):
+def show_phone(args: Sequence[str], book: AddressBook) -> str:
     name = args[0]
     record = book.find(name)
     if not record:
         raise KeyError("Contact not found.")
     if not record.phones:
         return "No phones."
-    return ", ".join(p.value for p in record.phones)
+    return ", ".join(record.phones)
 
 
-def show_all(book: AddressBook):
-    if not book.data:
+def show_all(book: AddressBook) -> str:
+    if not book:
         return "No contacts."
-    return "\n".join(str(record) for record in book.data.values())
+    return "\n".join(str(record) for record in book.values())
 
 
-@input_error
-def add_birthday(args, book: AddressBook):
+def add_birthday(args: Sequence[str], book: AddressBook) -> str:
     name, bday = args[:2]
     record = book.find(name)
     if not record:
@@ -245,8 +462,7 @@ def add_birthday(args, book: AddressBook):
     return "Birthday added."
 
 
-@input_error
-def show_birthday(args, book: AddressBook):
+def show_birthday(args: Sequence[str], book: AddressBook) -> str:
     name = args[0]
     record = book.find(name)
     if not record:
@@ -256,75 +472,88 @@ def show_birthday(args, book: AddressBook):
     return str(record.birthday)
 
 
-@input_error
-def birthdays(args, book: AddressBook):
+def birthdays(args: Sequence[str], book: AddressBook) -> str:
     upcoming = book.get_upcoming_birthdays()
     if not upcoming:
         return "No birthdays next week."
 
-    lines = []
+    lines: list[str] = []
     for item in upcoming:
         lines.append(f"{item['congratulation_date']}: {item['name']}")
     return "\n".join(lines)
 
 
+_COMMANDS: dict[str, Callable[[Sequence[str], AddressBook], str]] = {
+    "hello": lambda args, book: "How can I help you?",
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": lambda args, book: show_all(book),
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
+
 # ==========================
 #      ПАРСЕР КОМАНД
 # ==========================
 
-def parse_input(user_input: str):
-    parts = user_input.split()
+def parse_input(user_input: str) -> tuple[str, Sequence[str]]:
+    # відділяємо лише команду; решту ділимо, тільки якщо аргументи є
+    parts = user_input.split(maxsplit=1)
     if not parts:
-        return "", []
+        return "", ()
     cmd = parts[0].lower()
-    args = parts[1:]
-    return cmd, args
+    if len(parts) == 1:
+        return cmd, ()
+    return cmd, parts[1].split()
+
+
+def read_commands() -> Iterator[str]:
+    """Рядки команд: з input() в інтерактиві, з буферизованого stdin при пайпі."""
+    if sys.stdin.isatty():
+        while True:
+            yield input("Enter a command: ")
+    else:
+        yield from sys.stdin
 
 
 # ==========================
 #           MAIN
 # ==========================
 
-def main():
-    book = load_data()
+def main() -> None:
+    try:
+        book = load_data()
+    except Exception as e:
+        # виходимо без save_data, щоб не затерти файл, який не вдалося прочитати
+        print(f"Could not load {FILE_NAME}: {e}")
+        return
     print("Welcome to the assistant bot!")
 
-    while True:
-        user_input = input("Enter a command: ")
+    for user_input in read_commands():
         command, args = parse_input(user_input)
 
         if command in ("exit", "close"):
-            save_data(book)
-            print("Good bye!")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-
-        elif command == "add":
-            print(add_contact(args, book))
-
-        elif command == "change":
-            print(change_contact(args, book))
-
-        elif command == "phone":
-            print(show_phone(args, book))
-
-        elif command == "all":
-            print(show_all(book))
-
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(birthdays(args, book))
-
+        handler = _COMMANDS.get(command)
+        if handler:
+            # єдиний try на всі хендлери замість декоратора на кожному
+            try:
+                print(handler(args, book))
+            except (ValueError, KeyError, IndexError) as e:
+                print(f"Error: {e}")
+            except Exception as e:
+                print(f"Unexpected error: {e}")
         else:
             print("Invalid command. Type: add / change / phone / all / add-birthday / show-birthday / birthdays / exit")
 
+    # exit/close або кінець вхідного потоку
+    save_data(book)
+    print("Good bye!")
+
 
 if __name__ == "__main__":
     main()
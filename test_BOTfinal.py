@@ -0,0 +1,247 @@
+import copy
+from datetime import date
+import io
+import pickle
+
+import pytest
+
+import BOTfinal
+from BOTfinal import AddressBook, Record, load_data, save_data
+
+
+# AddressBook з двома контактами, збережена базовою версією (UserDict, pickle за замовчуванням)
+BASELINE_PICKLE = (
+    b'\x80\x04\x95"\x01\x00\x00\x00\x00\x00\x00\x8c\x08BOTfinal\x94\x8c\x0bAddressBook\x94\x93\x94)'
+    b'\x81\x94}\x94\x8c\x04data\x94}\x94(\x8c\x03Ann\x94h\x00\x8c\x06Record\x94\x93\x94)\x81\x94}\x94('
+    b'\x8c\x04name\x94h\x00\x8c\x04Name\x94\x93\x94)\x81\x94}\x94\x8c\x05value\x94h\x07sb\x8c\x06phones'
+    b'\x94]\x94(h\x00\x8c\x05Phone\x94\x93\x94)\x81\x94}\x94\x8c\x06_value\x94\x8c\n0123456789\x94sbh'
+    b'\x15)\x81\x94}\x94h\x18\x8c\n1111111111\x94sbe\x8c\x08birthday\x94h\x00\x8c\x08Birthday\x94\x93'
+    b'\x94)\x81\x94}\x94h\x18\x8c\x08datetime\x94\x8c\x04date\x94\x93\x94C\x04\x07\xc6\n\x10\x94\x85'
+    b'\x94R\x94sbub\x8c\x03Bob\x94h\t)\x81\x94}\x94(h\x0ch\x0e)\x81\x94}\x94h\x11h(sbh\x12]\x94h\x1dN'
+    b'ubusb.'
+)
+
+
+def make_record(name, *phones, birthday=None):
+    record = Record(name)
+    for phone in phones:
+        record.add_phone(phone)
+    if birthday:
+        record.add_birthday(birthday)
+    return record
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """Фіксує date.today() всередині BOTfinal."""
+    def set_today(value):
+        class FixedDate(date):
+            @classmethod
+            def today(cls):
+                return cls(value.year, value.month, value.day)
+        monkeypatch.setattr(BOTfinal, "date", FixedDate)
+    return set_today
+
+
+def test_load_baseline_pickle(tmp_path):
+    path = tmp_path / "addressbook.pkl"
+    path.write_bytes(BASELINE_PICKLE)
+
+    book = load_data(str(path))
+
+    assert list(book) == ["Ann", "Bob"]
+    assert str(book["Ann"]) == "Contact name: Ann, phones: 0123456789; 1111111111, birthday: 16.10.1990"
+    assert str(book["Bob"]) == "Contact name: Bob, phones: no phones"
+    assert book._bday_index == [(10 * 32 + 16, "Ann")]
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / "addressbook.pkl")
+    book = AddressBook()
+    book.add_record(make_record("Ann", "0123456789", "1111111111", birthday="16.10.1990"))
+    book.add_record(make_record("Bob"))
+
+    save_data(book, path)
+    loaded = load_data(path)
+
+    assert isinstance(loaded, AddressBook)
+    assert [str(r) for r in loaded.values()] == [str(r) for r in book.values()]
+    assert loaded._bday_index == book._bday_index
+    assert loaded["Ann"]._book is loaded
+
+
+def test_birthday_before_year_1000_round_trip(tmp_path):
+    path = str(tmp_path / "addressbook.pkl")
+    book = AddressBook()
+    book.add_record(make_record("Old", "1234567890", birthday="01.01.0999"))
+
+    save_data(book, path)
+    loaded = load_data(path)
+
+    assert loaded["Old"].birthday.value == book["Old"].birthday.value
+    assert pickle.loads(pickle.dumps(book["Old"].birthday)).value.year == 999
+
+
+def test_upcoming_birthdays_across_new_year(today):
+    today(date(2025, 12, 29))  # понеділок; вікно до 05.01.2026
+    book = AddressBook()
+    for name, bday in [
+        ("Past", "28.12.1990"),
+        ("Tue", "30.12.1990"),
+        ("Sat", "03.01.1990"),
+        ("Sun", "04.01.1990"),
+        ("Mon", "05.01.1990"),
+        ("Late", "06.01.1990"),
+        ("NoBday", None),
+    ]:
+        book.add_record(make_record(name, birthday=bday))
+
+    assert book.get_upcoming_birthdays() == [
+        {"name": "Tue", "congratulation_date": "2025.12.30"},
+        {"name": "Sat", "congratulation_date": "2026.01.05"},
+        {"name": "Sun", "congratulation_date": "2026.01.05"},
+        {"name": "Mon", "congratulation_date": "2026.01.05"},
+    ]
+
+
+def test_upcoming_birthdays_follow_dict_mutations(today):
+    today(date(2025, 6, 2))
+    book = AddressBook()
+    book["Ann"] = make_record("Ann", birthday="03.06.1990")
+    book.update(Bob=make_record("Bob", birthday="04.06.1990"))
+
+    del book["Ann"]
+    book["Bob"].birthday = None
+
+    assert book.get_upcoming_birthdays() == []
+    assert book._bday_index == []
+
+
+def test_phone_edits_invalidate_cached_string():
+    record = make_record("Ann", "0123456789", "1111111111")
+    assert str(record) == "Contact name: Ann, phones: 0123456789; 1111111111"
+
+    record.edit_phone("0123456789", "2222222222")
+    assert list(record.phones) == ["1111111111", "2222222222"]
+    assert str(record) == "Contact name: Ann, phones: 1111111111; 2222222222"
+
+    record.remove_phone("1111111111")
+    assert record.find_phone("1111111111") is None
+    assert str(record) == "Contact name: Ann, phones: 2222222222"
+
+    record.remove_phone("2222222222")
+    assert str(record) == "Contact name: Ann, phones: no phones"
+
+
+def test_edit_phone_with_invalid_number_keeps_old_one():
+    record = make_record("Ann", "0123456789")
+
+    with pytest.raises(ValueError):
+        record.edit_phone("0123456789", "123")
+
+    assert list(record.phones) == ["0123456789"]
+    assert str(record) == "Contact name: Ann, phones: 0123456789"
+
+
+def test_birthday_value_is_read_only(today):
+    today(date(2025, 6, 2))
+    book = AddressBook()
+    book.add_record(make_record("Ann", birthday="03.06.1990"))
+
+    with pytest.raises(AttributeError):
+        book["Ann"].birthday.value = date(1990, 12, 25)
+
+    assert book.get_upcoming_birthdays() == [{"name": "Ann", "congratulation_date": "2025.06.03"}]
+    del book["Ann"]
+    assert book._bday_index == []
+
+
+def test_upcoming_birthdays_skip_names_missing_from_book(today):
+    today(date(2025, 6, 2))
+    book = AddressBook()
+    book.add_record(make_record("Ann", birthday="03.06.1990"))
+
+    dict.__delitem__(book, "Ann")  # в обхід індексу
+
+    assert book.get_upcoming_birthdays() == []
+
+
+@pytest.mark.parametrize("make_copy", [copy.copy, AddressBook.copy])
+def test_copy_does_not_steal_records(today, make_copy):
+    today(date(2025, 6, 2))
+    book = AddressBook()
+    book.add_record(make_record("Ann", "0123456789", birthday="03.06.1990"))
+
+    copied = make_copy(book)
+    book["Ann"].add_birthday("04.06.1990")
+    copied["Ann"].add_phone("1111111111")
+
+    assert isinstance(copied, AddressBook)
+    assert copied["Ann"] is not book["Ann"]
+    assert book["Ann"]._book is book
+    assert copied["Ann"]._book is copied
+    assert book.get_upcoming_birthdays() == [{"name": "Ann", "congratulation_date": "2025.06.04"}]
+    assert copied.get_upcoming_birthdays() == [{"name": "Ann", "congratulation_date": "2025.06.03"}]
+    assert list(book["Ann"].phones) == ["0123456789"]
+
+
+def test_unreadable_file_is_not_overwritten(tmp_path, monkeypatch):
+    path = tmp_path / "addressbook.pkl"
+    path.write_bytes(b"not a pickle")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.stdin", io.StringIO("hello\nexit\n"))
+
+    with pytest.raises(pickle.UnpicklingError):
+        load_data(str(path))
+    BOTfinal.main()
+
+    assert path.read_bytes() == b"not a pickle"
+
+
+def test_bulk_import_merges_records(today):
+    today(date(2025, 6, 2))
+    book = AddressBook()
+    book.add_record(make_record("Ann", "0123456789"))
+
+    book.bulk_import([
+        ("Ann", ["1111111111"], "03.06.1990"),
+        ("Bob", ["2222222222", "3333333333"], None),
+        ("Cid", [], "05.06.1990"),
+    ])
+
+    assert list(book) == ["Ann", "Bob", "Cid"]
+    assert list(book["Ann"].phones) == ["0123456789", "1111111111"]
+    assert str(book["Bob"]) == "Contact name: Bob, phones: 2222222222; 3333333333"
+    assert book["Ann"]._book is book
+    assert book._bday_index == [(6 * 32 + 3, "Ann"), (6 * 32 + 5, "Cid")]
+    assert book.get_upcoming_birthdays() == [
+        {"name": "Ann", "congratulation_date": "2025.06.03"},
+        {"name": "Cid", "congratulation_date": "2025.06.05"},
+    ]
+
+
+def test_phone_constructor_always_validates():
+    with pytest.raises(ValueError):
+        BOTfinal.Phone("123", object())
+    assert BOTfinal.Phone.from_validated("123").value == "123"
+
+
+def test_phones_view_is_read_only():
+    record = make_record("Ann", "0123456789")
+    assert str(record) == "Contact name: Ann, phones: 0123456789"
+
+    with pytest.raises(TypeError):
+        record.phones["1111111111"] = BOTfinal.Phone("1111111111")
+
+    record.add_phone("1111111111")
+    assert list(record.phones) == ["0123456789", "1111111111"]
+    assert str(record) == "Contact name: Ann, phones: 0123456789; 1111111111"
+
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("  ADD  Ann\t0123456789 ", ("add", ["Ann", "0123456789"])),
+    ("hello", ("hello", ())),
+    ("", ("", ())),
+])
+def test_parse_input(user_input, expected):
+    assert BOTfinal.parse_input(user_input) == expected